@@ -2,16 +2,28 @@
 한국 전래동화 AI 스토리텔링 시스템 - Streamlit Web App
 """
 
+import asyncio
+import functools
+import hashlib
 import json
 import random
-import xml.etree.ElementTree as ET
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
-from typing import Dict, List, Optional
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 import requests
 import streamlit as st
-from google import genai
-from PIL import Image
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from lxml import etree as ET
+
+# google-genai와 PIL은 임포트가 무거워(수백 ms) 실제 사용 시점에
+# 지연 임포트한다. 타입 힌트용으로만 여기서 참조
+if TYPE_CHECKING:
+    from PIL import Image
 
 # 페이지 설정
 st.set_page_config(
@@ -21,7 +33,7 @@ st.set_page_config(
 )
 
 # CSS 스타일링
-st.markdown("""
+_CSS = """
     <style>
     .main-header {
         font-size: 3rem;
@@ -43,17 +55,44 @@ st.markdown("""
         font-size: 1.1rem;
     }
     </style>
-""", unsafe_allow_html=True)
+"""
+
+@st.cache_resource
+def inject_css():
+    """CSS 주입을 캐시해 재실행마다 스타일 블록을 다시 보내지 않는다"""
+    st.markdown(_CSS, unsafe_allow_html=True)
+
+inject_css()
 
 # FolktaleAPIClient 클래스
 class FolktaleAPIClient:
     """전래동화 API 클라이언트"""
-    
+
+    # 다운스트림에서 실제로 읽는 item 필드 (나머지 태그는 버린다)
+    _WANTED_TAGS = frozenset((
+        'title', 'creator', 'description', 'subjectKeyword',
+        'language', 'url', 'referenceIdentifier'
+    ))
+
     def __init__(self, api_key: str):
         self.api_key = api_key
         # 실제 엔드포인트
         self.base_url = "https://api.kcisa.kr/openapi/service/rest/meta14/getNLCF031801"
-        
+
+        # keep-alive 세션: 호출마다 TCP+TLS 핸드셰이크를 다시 하지 않고
+        # 일시적인 서버 오류는 백오프와 함께 재시도
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=4,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504]
+            )
+        ))
+        self.session.headers['Accept-Encoding'] = 'gzip'
+
     def get_folktales(self, page_no: int = 1, num_of_rows: int = 50) -> Dict:
         """전래동화 목록 조회"""
         if not self.api_key:
@@ -66,29 +105,56 @@ class FolktaleAPIClient:
         }
         
         try:
-            response = requests.get(self.base_url, params=params, timeout=30)
+            response = self.session.get(self.base_url, params=params, timeout=30)
             
             if response.status_code != 200:
                 return {"error": f"HTTP {response.status_code}", "message": "API 요청 실패"}
             
-            # XML 응답 파싱
-            return self._parse_xml(response.text)
+            # XML 응답 파싱 (bytes 그대로 넘겨 불필요한 디코딩 생략)
+            return self._parse_xml(response.content)
                 
         except Exception as e:
             return {"error": "exception", "message": str(e)}
     
-    def _parse_xml(self, xml_text: str) -> Dict:
+    def get_folktales_pages(self, pages: List[int], num_of_rows: int = 50) -> List[Dict]:
+        """여러 페이지를 동시에 조회
+
+        requests는 I/O 대기 중 GIL을 놓으므로 N페이지 조회가
+        N번의 왕복이 아니라 한 번의 왕복 시간에 끝난다.
+        """
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            return list(executor.map(
+                lambda page: self.get_folktales(page, num_of_rows), pages
+            ))
+
+    def _parse_xml(self, xml_bytes: bytes) -> Dict:
         """XML 응답 파싱"""
         try:
-            root = ET.fromstring(xml_text)
-            
-            # resultCode 확인
-            result_code = root.find('.//resultCode')
-            result_msg = root.find('.//resultMsg')
-            
-            code = result_code.text if result_code is not None else '00'
-            msg = result_msg.text if result_msg is not None else 'SUCCESS'
-            
+            code = '00'
+            msg = 'SUCCESS'
+            items = []
+            wanted = self._WANTED_TAGS
+
+            # 단일 패스 스트리밍 파싱: item을 만들자마자 해당 서브트리를
+            # 해제해 응답 크기와 무관하게 메모리가 일정하게 유지된다
+            for _, elem in ET.iterparse(BytesIO(xml_bytes), events=('end',)):
+                tag = elem.tag
+                if tag == 'resultCode':
+                    code = elem.text if elem.text else code
+                elif tag == 'resultMsg':
+                    msg = elem.text if elem.text else msg
+                elif tag == 'header':
+                    # 오류 응답이면 items까지 읽을 필요 없음
+                    # (resultMsg까지 읽은 뒤 header가 닫힐 때 중단)
+                    if code not in ['00', '0000']:
+                        break
+                elif tag == 'item':
+                    items.append({child.tag: child.text for child in elem
+                                  if child.tag in wanted})
+                    elem.clear()
+                    while elem.getprevious() is not None:
+                        del elem.getparent()[0]
+
             # 0000 또는 00은 정상
             if code not in ['00', '0000']:
                 return {
@@ -101,15 +167,7 @@ class FolktaleAPIClient:
                         }
                     }
                 }
-            
-            # items 파싱
-            items = []
-            for item in root.findall('.//item'):
-                item_dict = {}
-                for child in item:
-                    item_dict[child.tag] = child.text
-                items.append(item_dict)
-           
+
             return {
                 'response': {
                     'header': {
@@ -137,32 +195,207 @@ class FolktaleAPIClient:
             'thumbnail': item.get('referenceIdentifier', '')
         }
 
+@st.cache_resource
+def get_genai_client(api_key: str):
+    """재실행 간 재사용되는 Gemini 클라이언트 싱글턴
+
+    매 재실행마다 HTTP 클라이언트와 인증 체인을 새로 만드는 대신
+    한 번 만들어 커넥션을 계속 재사용한다.
+    """
+    from google import genai
+
+    return genai.Client(api_key=api_key)
+
+@st.cache_resource
+def get_folktale_client(api_key: str) -> FolktaleAPIClient:
+    """커넥션 풀(Session)을 유지하는 전래동화 API 클라이언트 싱글턴"""
+    return FolktaleAPIClient(api_key)
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def load_folktales(api_key: str, pages: tuple = (1,), num_of_rows: int = 50) -> Dict:
+    """전래동화 목록을 가져와 표준 형식으로 변환 (1시간 캐시)
+
+    여러 페이지를 동시에 조회해 카탈로그 전체를 한 번의 스피너로 채운다.
+    """
+    client = get_folktale_client(api_key)
+    results = client.get_folktales_pages(list(pages), num_of_rows)
+
+    # 첫 페이지 오류는 키 문제 등이므로 그대로 전달
+    if results and "error" in results[0]:
+        return results[0]
+
+    stories = []
+    for data in results:
+        if "error" in data:
+            continue
+        items = data.get('response', {}).get('body', {}).get('items', [])
+        for item in items:
+            # 본문 길이로 먼저 걸러내고, 통과한 item만 표준 형식으로 투영
+            content = item.get('description') or item.get('title') or ''
+            if len(content) <= 50:
+                continue
+            stories.append({
+                'title': item.get('title', '제목 없음'),
+                'author': item.get('creator', '저자 미상'),
+                'content': content,
+                # 표시용 축약본을 미리 만들어 재실행마다 슬라이싱하지 않는다
+                'content_preview': content[:500] + "..." if len(content) > 500 else content,
+                'keyword': item.get('subjectKeyword', ''),
+                'language': item.get('language', '한국어'),
+                'url': item.get('url', ''),
+                'thumbnail': item.get('referenceIdentifier', '')
+            })
+
+    # 제목 → 이야기 매핑: 재실행마다 목록을 훑는 대신 O(1) 조회
+    stories_by_title = {}
+    for story in stories:
+        title = story['title']
+        if title in stories_by_title:
+            # 제목이 겹치면 번호를 붙여 고유하게 유지
+            suffix = 2
+            while f"{title} ({suffix})" in stories_by_title:
+                suffix += 1
+            title = f"{title} ({suffix})"
+            story['title'] = title
+        stories_by_title[title] = story
+
+    return {'stories': stories, 'stories_by_title': stories_by_title}
+
+@st.cache_resource
+def _placeholder_image() -> "Image.Image":
+    """우측 컬럼용 로컬 플레이스홀더 (외부 이미지 요청 제거)"""
+    from PIL import Image
+
+    return Image.open(Path(__file__).parent / "assets" / "placeholder.png")
+
+def _encode_png(image: "Image.Image") -> bytes:
+    """다운로드용 PNG 인코딩 (compress_level=1: 용량보다 속도 우선)"""
+    buf = BytesIO()
+    image.save(buf, format="PNG", optimize=False, compress_level=1)
+    return buf.getvalue()
+
+def _make_preview(image: "Image.Image") -> "Image.Image":
+    """화면 표시용 다운스케일 복사본 (다운로드용 원본은 그대로 유지)"""
+    from PIL import Image
+
+    preview = image.copy()
+    preview.thumbnail((768, 768), Image.Resampling.LANCZOS)
+    return preview
+
+# Gemini 텍스트 응답 캐시 (메모리 LRU + sqlite 영속화)
+_GEMINI_CACHE_DB = Path(".gemini_cache.db")
+
+# 생성 이미지 디스크 캐시 (sha256(프롬프트) → PNG)
+_IMAGE_CACHE_DIR = Path(".img_cache")
+
+def _gemini_cache_conn() -> sqlite3.Connection:
+    """캐시 DB 연결 생성 (테이블이 없으면 생성)"""
+    conn = sqlite3.connect(_GEMINI_CACHE_DB)
+    conn.execute("CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT)")
+    return conn
+
+def _cache_key(model: str, prompt: str, mime_type: Optional[str] = None) -> str:
+    """(모델, 프롬프트) 조합의 캐시 키"""
+    return hashlib.sha256(f"{model}|{mime_type}|{prompt}".encode()).hexdigest()
+
+def _cache_get(key: str) -> Optional[str]:
+    """sqlite 캐시 조회 (없으면 None)"""
+    conn = _gemini_cache_conn()
+    try:
+        row = conn.execute("SELECT value FROM cache WHERE key=?", (key,)).fetchone()
+        return row[0] if row else None
+    finally:
+        conn.close()
+
+def _cache_set(key: str, value: str) -> None:
+    """sqlite 캐시 저장"""
+    conn = _gemini_cache_conn()
+    try:
+        conn.execute("INSERT OR REPLACE INTO cache (key, value) VALUES (?, ?)", (key, value))
+        conn.commit()
+    finally:
+        conn.close()
+
+@functools.lru_cache(maxsize=512)
+def _generate_text_cached(api_key: str, model: str, prompt: str,
+                          mime_type: Optional[str] = None) -> str:
+    """동일한 (모델, 프롬프트) 조합의 Gemini 호출 결과를 캐시
+
+    메모리 LRU가 세션 내 반복 호출을, sqlite가 세션 간 반복 호출을
+    흡수하므로 같은 전래동화를 다시 요약할 때 API 왕복이 없다.
+    """
+    key = _cache_key(model, prompt, mime_type)
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
+
+    response = get_genai_client(api_key).models.generate_content(
+        model=model,
+        contents=prompt,
+        config={"response_mime_type": mime_type} if mime_type else None
+    )
+    _cache_set(key, response.text)
+    return response.text
+
 # StorytellingAI 클래스
 class StorytellingAI:
     """Gemini AI를 활용한 스토리텔링 시스템"""
-    
+
     def __init__(self, api_key: str):
-        self.client = genai.Client(api_key=api_key)
-        
-    def summarize_story(self, title: str, content: str) -> str:
-        """전래동화 줄거리 요약"""
-        prompt = f"""
+        self.api_key = api_key
+        self.client = get_genai_client(api_key)
+
+    @staticmethod
+    def _summary_prompt(title: str, content: str) -> str:
+        """줄거리 요약용 프롬프트"""
+        return f"""
         다음 한국 전래동화를 어린이가 이해하기 쉽게 3-5문장으로 요약해주세요.
-        
+
         제목: {title}
         내용: {content}
-        
+
         요약은 재미있고 교훈적인 내용을 포함해야 합니다.
         """
-        
+
+    def summarize_story(self, title: str, content: str) -> str:
+        """전래동화 줄거리 요약"""
         try:
-            response = self.client.models.generate_content(
-                model="gemini-2.0-flash-exp",
-                contents=prompt
+            return _generate_text_cached(
+                self.api_key, "gemini-2.0-flash-exp",
+                self._summary_prompt(title, content)
             )
-            return response.text
         except Exception as e:
             return f"요약 생성 실패: {str(e)}"
+
+    def summarize_story_stream(self, title: str, content: str):
+        """전래동화 줄거리를 스트리밍으로 요약
+
+        전체 응답을 기다리지 않고 첫 토큰부터 화면에 흘려보낸다.
+        캐시 적중 시 전문을 한 번에 내보내고, 스트리밍이 끝나면
+        완성본을 캐시에 저장해 다음 호출부터 즉시 반환되게 한다.
+        """
+        prompt = self._summary_prompt(title, content)
+        key = _cache_key("gemini-2.0-flash-exp", prompt)
+
+        cached = _cache_get(key)
+        if cached is not None:
+            yield cached
+            return
+
+        chunks = []
+        try:
+            for chunk in self.client.models.generate_content_stream(
+                model="gemini-2.0-flash-exp",
+                contents=prompt
+            ):
+                if chunk.text:
+                    chunks.append(chunk.text)
+                    yield chunk.text
+        except Exception as e:
+            yield f"요약 생성 실패: {str(e)}"
+            return
+
+        _cache_set(key, ''.join(chunks))
     
     def create_image_prompt(self, title: str, summary: str) -> str:
         """이미지 생성을 위한 프롬프트 생성"""
@@ -183,32 +416,114 @@ class StorytellingAI:
         """
         
         try:
-            response = self.client.models.generate_content(
-                model="gemini-2.0-flash-exp",
-                contents=prompt
-            )
-            return response.text.strip()
+            return _generate_text_cached(self.api_key, "gemini-2.0-flash-exp", prompt).strip()
         except Exception as e:
             return f"A warm and friendly Korean folktale illustration about {title}"
     
-    def generate_image(self, prompt: str) -> Optional[Image.Image]:
-        """Gemini로 이미지 생성"""
+    def summarize_and_prompt(self, title: str, content: str) -> Dict:
+        """요약과 이미지 프롬프트를 Gemini 한 번의 호출로 생성
+
+        별도 호출 두 번 대신 구조화 JSON 출력 한 번으로 받아
+        요청 수와 왕복 지연을 절반으로 줄인다.
+        """
+        prompt = f"""
+        다음 한국 전래동화에 대해 두 가지를 생성해주세요.
+
+        제목: {title}
+        내용: {content}
+
+        1. "summary": 어린이가 이해하기 쉬운 3-5문장 요약.
+           재미있고 교훈적인 내용을 포함, 한국어로 작성.
+        2. "image_prompt": 핵심 장면을 그림으로 표현하기 위한 프롬프트.
+           동화적이고 따뜻한 느낌, 한국 전통 요소 포함, 어린이 친화적,
+           영어로 50 단어 이내.
+
+        {{"summary": "...", "image_prompt": "..."}} 형식의 JSON만 출력해주세요.
+        """
+
+        key = _cache_key("gemini-2.0-flash-exp", prompt, "application/json")
+
+        try:
+            result = None
+            cached = _cache_get(key)
+            if cached is not None:
+                try:
+                    result = json.loads(cached)
+                except ValueError:
+                    # 잘못 저장된 항목은 버리고 새로 생성
+                    result = None
+
+            if result is None:
+                response = self.client.models.generate_content(
+                    model="gemini-2.0-flash-exp",
+                    contents=prompt,
+                    config={"response_mime_type": "application/json"}
+                )
+                # 온전한 JSON으로 파싱된 응답만 캐시에 저장
+                # (잘린 응답이 영구히 캐시되는 것을 방지)
+                result = json.loads(response.text)
+                _cache_set(key, response.text)
+
+            return {
+                'summary': result.get('summary', ''),
+                'image_prompt': result.get('image_prompt', '').strip()
+            }
+        except Exception as e:
+            return {
+                'summary': f"요약 생성 실패: {str(e)}",
+                'image_prompt': f"A warm and friendly Korean folktale illustration about {title}"
+            }
+
+    async def generate_story_assets(self, title: str, content: str):
+        """요약과 이미지를 한 번에 생성하는 비동기 파이프라인
+
+        요약과 이미지 프롬프트는 Gemini 한 번의 호출로 함께 받고,
+        이미지 생성만 프롬프트를 기다린다.
+        """
+        result = await asyncio.to_thread(self.summarize_and_prompt, title, content)
+        image = await asyncio.to_thread(self.generate_image, result['image_prompt'])
+        return result['summary'], result['image_prompt'], image
+
+    def generate_image(self, prompt: str) -> Optional["Image.Image"]:
+        """Gemini로 이미지 생성 (동일 프롬프트는 디스크 캐시에서 반환)"""
+        from PIL import Image
+
+        key = hashlib.sha256(prompt.encode()).hexdigest()
+        _IMAGE_CACHE_DIR.mkdir(exist_ok=True)
+        cache_path = _IMAGE_CACHE_DIR / f"{key}.png"
+
+        if cache_path.exists():
+            return Image.open(cache_path)
+
         try:
             response = self.client.models.generate_content(
                 model="gemini-2.5-flash-image",
                 contents=[prompt],
             )
-            
+
             for part in response.candidates[0].content.parts:
                 if part.inline_data is not None:
                     image = Image.open(BytesIO(part.inline_data.data))
+                    image.save(cache_path, "PNG")
                     return image
-            
+
             return None
-        except Exception as e:
-            st.error(f"이미지 생성 실패: {str(e)}")
+        except Exception:
+            # 백그라운드 스레드에서도 호출되므로 UI 출력은 호출부에 맡긴다
             return None
 
+# 백그라운드 선요약이 Gemini 쿼터를 독점하지 않도록 동시 2건으로 제한
+_PREFETCH_SEMAPHORE = threading.Semaphore(2)
+
+def _prefetch_story(ai: StorytellingAI, story: Dict) -> None:
+    """이야기의 요약+프롬프트를 미리 생성해 캐시에 채워 둔다
+
+    결과는 공용 메모리/sqlite 캐시로 들어가므로 별도의 UI 연결 없이
+    버튼 핸들러가 캐시 적중으로 즉시 읽는다.
+    """
+    with _PREFETCH_SEMAPHORE:
+        ai.summarize_and_prompt(story['title'], story.get('content', ''))
+
 # 세션 스테이트 초기화
 if 'api_keys_set' not in st.session_state:
     st.session_state.api_keys_set = False
@@ -216,8 +531,17 @@ if 'selected_story' not in st.session_state:
     st.session_state.selected_story = None
 if 'summary' not in st.session_state:
     st.session_state.summary = None
+if 'image_prompt' not in st.session_state:
+    st.session_state.image_prompt = None
 if 'generated_image' not in st.session_state:
     st.session_state.generated_image = None
+if 'generated_image_preview' not in st.session_state:
+    st.session_state.generated_image_preview = None
+if 'png_bytes' not in st.session_state:
+    st.session_state.png_bytes = None
+if 'prefetch_pool' not in st.session_state:
+    # 선택 직후 요약을 미리 만들어 두는 백그라운드 풀
+    st.session_state.prefetch_pool = ThreadPoolExecutor(max_workers=2)
 
 # 메인 UI
 st.markdown('<h1 class="main-header">📚 한국 전래동화 AI 스토리텔링</h1>', unsafe_allow_html=True)
@@ -277,45 +601,28 @@ else:
         st.error("공공데이터 API 키를 입력해주세요!")
         st.stop()
     
-    folktale_client = FolktaleAPIClient(st.session_state.data_gov_api_key)
-    
-    # 전래동화 데이터 수집
-    collected_stories = []
-    
+    # 전래동화 데이터 수집 (캐시되어 재실행 시 API를 다시 호출하지 않음)
     with st.spinner("전래동화 데이터를 불러오는 중..."):
-        data = folktale_client.get_folktales(page_no=1, num_of_rows=50)
-        
-        if "error" not in data:
-            try:
-                items = data.get('response', {}).get('body', {}).get('items', [])
-                
-                if items:
-                    for item in items:
-                        story = folktale_client.get_item_details(item)
-                        # 본문이 있는 것만 수집
-                        if story['content'] and len(story['content']) > 50:
-                            collected_stories.append(story)
-                    
-                    if collected_stories:
-                        st.success(f"✅ {len(collected_stories)}개의 전래동화를 불러왔습니다!")
-                    else:
-                        st.warning("유효한 전래동화를 찾을 수 없습니다.")
-                else:
-                    st.warning("항목이 비어있습니다.")
-            except Exception as e:
-                st.error(f"데이터 처리 오류: {str(e)}")
+        data = load_folktales(st.session_state.data_gov_api_key, (1, 2), 50)
+
+    if "error" in data:
+        # API 오류 처리 (오류 응답은 캐시에서 제거)
+        load_folktales.clear()
+        result_code = data.get('response', {}).get('header', {}).get('resultCode', '')
+        result_msg = data.get('response', {}).get('header', {}).get('resultMsg', data.get('message', ''))
+
+        if result_code == '12':
+            st.error("활용 신청 승인 대기 중이거나 API 키가 잘못되었습니다.")
         else:
-            # API 오류 처리
-            result_code = data.get('response', {}).get('header', {}).get('resultCode', '')
-            result_msg = data.get('response', {}).get('header', {}).get('resultMsg', data.get('message', ''))
-            
-            if result_code == '12':
-                st.error("활용 신청 승인 대기 중이거나 API 키가 잘못되었습니다.")
-            else:
-                st.error(f"API 오류: {result_msg}")
-            st.stop()
-    
-    if not collected_stories:
+            st.error(f"API 오류: {result_msg}")
+        st.stop()
+
+    collected_stories = data['stories']
+    stories_by_title = data['stories_by_title']
+
+    if collected_stories:
+        st.success(f"✅ {len(collected_stories)}개의 전래동화를 불러왔습니다!")
+    else:
         st.error("사용 가능한 전래동화가 없습니다.")
         st.stop()
     
@@ -330,52 +637,102 @@ else:
             key="story_selector"
         )
         
-        # 선택된 이야기 찾기
-        selected_story = next((s for s in collected_stories if s['title'] == selected_title), None)
+        # 선택된 이야기 조회
+        selected_story = stories_by_title.get(selected_title)
         
         if selected_story:
             st.session_state.selected_story = selected_story
-            
+
+            # 선택 즉시 백그라운드에서 요약+프롬프트 생성을 시작해 두면
+            # 사용자가 버튼을 누를 때는 대부분 이미 완료되어 있다
+            if st.session_state.get('prefetched_title') != selected_story['title']:
+                st.session_state.prefetched_title = selected_story['title']
+                st.session_state.prefetch_future = st.session_state.prefetch_pool.submit(
+                    storytelling_ai.summarize_and_prompt,
+                    selected_story['title'],
+                    selected_story.get('content', '')
+                )
+
             with st.container():
                 st.markdown('<div class="story-card">', unsafe_allow_html=True)
                 st.subheader(f"📖 {selected_story['title']}")
                 st.write(f"**저자:** {selected_story['author']}")
                 
-                # 내용을 적절히 잘라서 표시
-                content = selected_story['content']
-                if len(content) > 500:
-                    content = content[:500] + "..."
-                st.write(f"**내용:** {content}")
+                # 로드 시 미리 잘라둔 축약본 표시
+                st.write(f"**내용:** {selected_story['content_preview']}")
                 
                 if selected_story.get('keyword'):
                     st.write(f"**키워드:** {selected_story['keyword']}")
                 st.markdown('</div>', unsafe_allow_html=True)
     
     with col2:
-        st.image("https://via.placeholder.com/300x400?text=Korean+Folktale", 
-                 use_column_width=True)
+        st.image(_placeholder_image(), use_column_width=True)
     
     st.markdown("---")
-    
+
+    # 요약 + 이미지 동시 생성
+    if st.button("⚡ 요약 + 이미지 한 번에 생성"):
+        if st.session_state.selected_story:
+            with st.spinner("AI가 요약과 이미지를 함께 생성하고 있습니다... (약 10-20초 소요)"):
+                summary, image_prompt, generated_image = asyncio.run(
+                    storytelling_ai.generate_story_assets(
+                        st.session_state.selected_story['title'],
+                        st.session_state.selected_story.get('content', '')
+                    )
+                )
+                st.session_state.summary = summary
+                st.session_state.image_prompt = image_prompt
+                if generated_image:
+                    st.session_state.generated_image = generated_image
+                    st.session_state.generated_image_preview = _make_preview(generated_image)
+                    st.session_state.png_bytes = _encode_png(generated_image)
+                else:
+                    st.error("이미지 생성 실패")
+
     # AI 요약 생성
     st.header("2️⃣ AI 줄거리 요약")
     
     col1, col2 = st.columns([1, 3])
     
     with col1:
-        if st.button( " AI 요약 생성", use_container_width=True):
-            if st.session_state.selected_story:
-                with st.spinner("AI가 줄거리를 요약하고 있습니다..."):
-                    summary = storytelling_ai.summarize_story(
-                        st.session_state.selected_story['title'],
-                        st.session_state.selected_story.get('content', '')
-                    )
-                    st.session_state.summary = summary
-    
+        summarize_clicked = st.button( " AI 요약 생성", use_container_width=True)
+
     with col2:
+        streamed = False
+        if summarize_clicked and st.session_state.selected_story:
+            # 선택 시점에 미리 시작한 백그라운드 작업이 끝났으면
+            # 요약과 이미지 프롬프트를 즉시 사용
+            future = st.session_state.get('prefetch_future')
+            if future is not None and future.done():
+                result = future.result()
+                st.session_state.summary = result['summary']
+                st.session_state.image_prompt = result['image_prompt']
+            else:
+                # 아직이면 전체 완료를 기다리지 않고 첫 토큰부터 스트리밍
+                summary = st.write_stream(storytelling_ai.summarize_story_stream(
+                    st.session_state.selected_story['title'],
+                    st.session_state.selected_story.get('content', '')
+                ))
+                st.session_state.summary = summary
+                # 스트리밍 경로에는 프롬프트가 없으므로 이미지 단계에서 생성
+                st.session_state.image_prompt = None
+                streamed = True
+
+            # 현재 요약이 끝났으니 인접 이야기들을 유휴 시간에 미리 요약해
+            # 다음 이야기로 넘어갈 때는 캐시 적중으로 즉시 표시되게 한다
+            current_index = story_titles.index(selected_title)
+            for offset in (1, -1, 2, -2):
+                neighbor = current_index + offset
+                if 0 <= neighbor < len(story_titles):
+                    st.session_state.prefetch_pool.submit(
+                        _prefetch_story, storytelling_ai,
+                        stories_by_title[story_titles[neighbor]]
+                    )
+
         if st.session_state.summary:
             st.success("AI 요약 완료!")
-            st.write(st.session_state.summary)
+            if not streamed:
+                st.write(st.session_state.summary)
     
     st.markdown("---")
     
@@ -388,12 +745,14 @@ else:
         if st.button("이미지 생성", use_container_width=True):
             if st.session_state.summary:
                 with st.spinner("AI가 이미지를 생성하고 있습니다... (약 10-20초 소요)"):
-                    # 이미지 프롬프트 생성
-                    image_prompt = storytelling_ai.create_image_prompt(
-                        st.session_state.selected_story['title'],
-                        st.session_state.summary
-                    )
-                    
+                    # 요약 단계에서 함께 생성된 프롬프트를 재사용
+                    image_prompt = st.session_state.image_prompt
+                    if not image_prompt:
+                        image_prompt = storytelling_ai.create_image_prompt(
+                            st.session_state.selected_story['title'],
+                            st.session_state.summary
+                        )
+
                     st.info(f"생성 프롬프트: {image_prompt}")
                     
                     # 이미지 생성
@@ -401,6 +760,8 @@ else:
                     
                     if generated_image:
                         st.session_state.generated_image = generated_image
+                        st.session_state.generated_image_preview = _make_preview(generated_image)
+                        st.session_state.png_bytes = _encode_png(generated_image)
                         st.success("이미지 생성 완료!")
                     else:
                         st.error("이미지 생성 실패")
@@ -409,16 +770,17 @@ else:
     
     with col2:
         if st.session_state.generated_image:
-            st.image(st.session_state.generated_image, 
+            # 화면에는 다운스케일 프리뷰, 다운로드에는 원본 사용
+            st.image(st.session_state.generated_image_preview or st.session_state.generated_image,
                     caption=f"{st.session_state.selected_story['title']} - AI 생성 이미지",
                     use_column_width=True)
             
-            # 이미지 다운로드 버튼
-            buf = BytesIO()
-            st.session_state.generated_image.save(buf, format="PNG")
+            # 이미지 다운로드 버튼 (인코딩은 생성 시 한 번만 수행)
+            if st.session_state.png_bytes is None:
+                st.session_state.png_bytes = _encode_png(st.session_state.generated_image)
             btn = st.download_button(
                 label="이미지 다운로드",
-                data=buf.getvalue(),
+                data=st.session_state.png_bytes,
                 file_name=f"{st.session_state.selected_story['title']}_ai_image.png",
                 mime="image/png"
             )